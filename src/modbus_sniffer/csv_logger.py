@@ -1,7 +1,15 @@
 import os
 import csv
+import time
+import queue
+import threading
 from datetime import datetime
 
+# Write buffer size for CSV files, rows are flushed to disk in batches
+CSV_BUFFER_SIZE = 1 << 16
+# Rows waiting for the background writer thread before log_data blocks
+CSV_QUEUE_SIZE = 10000
+
 
 class CSVLogger:
     def __init__(
@@ -10,20 +18,43 @@ class CSVLogger:
         daily_file=False,
         output_dir=".",
         base_filename="modbus_data",
+        flush_rows=128,
+        flush_interval=1.0,
+        background=False,
     ):
         self.enable_csv = enable_csv
         self.daily_file = daily_file
         self.output_dir = output_dir
         self.base_filename = base_filename
-
+        # Rows are flushed in batches of flush_rows. Their age is checked
+        # against flush_interval only when a row is written, so in synchronous
+        # mode a quiet bus leaves the last rows buffered until the next row or
+        # close(). Only the background writer flushes idle rows on a timer.
+        self.flush_rows = flush_rows
+        self.flush_interval = flush_interval
+        self._rows_since_flush = 0
+        self._last_flush = time.monotonic()
+
+        # Column index of each logged register: {slave_id: {reg_addr: column}}
         self.register_map = {}
         self.columns = ["Timestamp", "Slave ID", "Operation"]
         self.csv_file = None
         self.csv_writer = None
         self.current_date_str = None
 
+        self._queue = None
+        self._thread = None
+        # Error raised on the writer thread, re-raised by log_data or close
+        self._error = None
+
         if self.enable_csv:
             self._open_csv_file()
+            if background:
+                # Disk I/O runs on its own thread so a slow disk never stalls
+                # the decoder reading the serial port.
+                self._queue = queue.Queue(maxsize=CSV_QUEUE_SIZE)
+                self._thread = threading.Thread(target=self._writer_loop, daemon=True)
+                self._thread.start()
 
     def _get_date_str(self):
         return datetime.now().strftime("%Y%m%d")
@@ -41,10 +72,16 @@ class CSVLogger:
         os.makedirs(self.output_dir, exist_ok=True)
         fullpath = os.path.join(self.output_dir, filename)
 
-        self.csv_file = open(fullpath, mode="w", newline="", encoding="utf-8")
+        self.csv_file = open(
+            fullpath,
+            mode="w",
+            newline="",
+            encoding="utf-8",
+            buffering=CSV_BUFFER_SIZE,
+        )
         self.csv_writer = csv.writer(self.csv_file)
         self.csv_writer.writerow(self.columns)
-        self.csv_file.flush()
+        self._flush()
 
         if self.daily_file:
             self.current_date_str = self._get_date_str()
@@ -58,13 +95,13 @@ class CSVLogger:
 
     def _expand_header_for_registers(self, slave_id, start_register, quantity):
         changed = False
+        slave_map = self.register_map.setdefault(slave_id, {})
         for offset in range(quantity):
             reg_addr = start_register + offset
-            key = (slave_id, reg_addr)
-            if key not in self.register_map:
+            if reg_addr not in slave_map:
                 new_col_name = f"Reg_{slave_id}_{reg_addr}"
                 self.columns.append(new_col_name)
-                self.register_map[key] = len(self.columns) - 1
+                slave_map[reg_addr] = len(self.columns) - 1
                 changed = True
 
         if changed:
@@ -76,32 +113,45 @@ class CSVLogger:
 
         self.csv_file.close()
         old_path = self.csv_file.name
+        tmp_path = old_path + ".tmp"
+
+        # Stream the old rows into a temporary file with the new header, so
+        # the logged history never has to be held in memory.
+        with open(old_path, mode="r", newline="", encoding="utf-8") as src, open(
+            tmp_path,
+            mode="w",
+            newline="",
+            encoding="utf-8",
+            buffering=CSV_BUFFER_SIZE,
+        ) as dst:
+            reader = csv.reader(src)
+            old_header = next(reader, [])
+
+            # Position of every old column in the new header, -1 if dropped
+            new_col_map = {name: idx for idx, name in enumerate(self.columns)}
+            remap = [new_col_map.get(col_name, -1) for col_name in old_header]
+            row_len = len(self.columns)
+
+            def remap_row(old_row):
+                new_row = [""] * row_len
+                for new_index, cell_value in zip(remap, old_row):
+                    if new_index >= 0:
+                        new_row[new_index] = cell_value
+                return new_row
 
-        with open(old_path, mode="r", encoding="utf-8") as f:
-            reader = list(csv.reader(f))
-
-        old_header = reader[0] if reader else []
-        old_rows = reader[1:] if len(reader) > 1 else []
-
-        with open(old_path, mode="w", newline="", encoding="utf-8") as f:
-            writer = csv.writer(f)
+            writer = csv.writer(dst)
             writer.writerow(self.columns)
+            writer.writerows(map(remap_row, reader))
 
-            old_col_map = {col_name: idx for idx, col_name in enumerate(old_header)}
-
-            for old_row in old_rows:
-                new_row = [""] * len(self.columns)
-                for col_index, col_name in enumerate(old_header):
-                    if col_index < len(old_row):
-                        cell_value = old_row[col_index]
-                    else:
-                        cell_value = ""
-                    if col_name in old_col_map and col_name in self.columns:
-                        new_index = self.columns.index(col_name)
-                        new_row[new_index] = cell_value
-                writer.writerow(new_row)
+        os.replace(tmp_path, old_path)
 
-        self.csv_file = open(old_path, mode="a", newline="", encoding="utf-8")
+        self.csv_file = open(
+            old_path,
+            mode="a",
+            newline="",
+            encoding="utf-8",
+            buffering=CSV_BUFFER_SIZE,
+        )
         self.csv_writer = csv.writer(self.csv_file)
 
     def log_data(
@@ -110,6 +160,59 @@ class CSVLogger:
         if not self.enable_csv:
             return
 
+        if self._queue is not None:
+            if not self._thread.is_alive():
+                raise RuntimeError("CSV writer thread is not running")
+            self._queue.put(
+                (
+                    timestamp,
+                    slave_id,
+                    operation,
+                    start_register,
+                    quantity,
+                    tuple(register_values),
+                )
+            )
+            # The row is queued first, so a failure of an earlier row never
+            # costs this one
+            self._raise_writer_error()
+            return
+
+        self._write_row(
+            timestamp, slave_id, operation, start_register, quantity, register_values
+        )
+
+    def _writer_loop(self):
+        while True:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                # Bus went quiet, make sure the last rows reach the disk
+                if self._rows_since_flush:
+                    self._run_guarded(self._flush)
+                continue
+            if item is not None:
+                self._run_guarded(self._write_row, *item)
+            self._queue.task_done()
+            if item is None:
+                break
+
+    def _raise_writer_error(self):
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run_guarded(self, func, *args):
+        # A failed write must not stop the thread, or log_data would block on
+        # a queue nobody drains. The error is handed back to the caller.
+        try:
+            func(*args)
+        except Exception as exc:
+            self._error = exc
+
+    def _write_row(
+        self, timestamp, slave_id, operation, start_register, quantity, register_values
+    ):
         self._check_daily_rotation()
         self._expand_header_for_registers(slave_id, start_register, quantity)
 
@@ -118,16 +221,35 @@ class CSVLogger:
         row[1] = slave_id
         row[2] = operation
 
-        for i, val in enumerate(register_values):
-            reg_addr = start_register + i
-            col_idx = self.register_map.get((slave_id, reg_addr), None)
+        slave_map = self.register_map.get(slave_id, {})
+        for offset, val in enumerate(register_values):
+            col_idx = slave_map.get(start_register + offset)
             if col_idx is not None:
                 row[col_idx] = val
 
         self.csv_writer.writerow(row)
+        self._rows_since_flush += 1
+        if (
+            self._rows_since_flush >= self.flush_rows
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        ):
+            self._flush()
+
+    def _flush(self):
         self.csv_file.flush()
+        self._rows_since_flush = 0
+        self._last_flush = time.monotonic()
 
     def close(self):
+        if self._thread:
+            if self._thread.is_alive():
+                # The sentinel is queued behind all pending rows
+                self._queue.put(None)
+                self._thread.join()
+            self._thread = None
+            self._queue = None
         if self.csv_file:
             self.csv_file.close()
             self.csv_file = None
+        # Failures of the last rows or the final flush must not go unnoticed
+        self._raise_writer_error()
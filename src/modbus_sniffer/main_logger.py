@@ -1,5 +1,6 @@
 import os
 import sys
+import time
 import logging
 from logging.handlers import TimedRotatingFileHandler
 from datetime import datetime
@@ -8,22 +9,47 @@ from datetime import datetime
 # --------------------------------------------------------------------------- #
 # Custom logging formatter
 # --------------------------------------------------------------------------- #
+def _colored_format(color):
+    return (
+        f"%(asctime)-15s \033[{color}m%(levelname)-8s %(threadName)-15s-"
+        "%(module)-15s:%(lineno)-8s\033[0m: %(message)s"
+    )
+
+
 class MyFormatter(logging.Formatter):
-    def format(self, record):
-        if record.levelno == logging.INFO:
-            self._style._fmt = "%(asctime)-15s %(message)s"
-        elif record.levelno == logging.DEBUG:
-            self._style._fmt = (
-                "%(asctime)-15s \033[36m%(levelname)-8s\033[0m: %(message)s"
-            )
-        else:
-            color = {
-                logging.WARNING: 33,
-                logging.ERROR: 31,
-                logging.FATAL: 31,
-            }.get(record.levelno, 0)
-            self._style._fmt = f"%(asctime)-15s \033[{color}m%(levelname)-8s %(threadName)-15s-%(module)-15s:%(lineno)-8s\033[0m: %(message)s"
-        return super().format(record)
+    # Built once and picked per record, instead of rewriting self._style on
+    # every call, which is also unsafe with handlers on several threads
+    _STYLES = {
+        logging.INFO: logging.PercentStyle("%(asctime)-15s %(message)s"),
+        logging.DEBUG: logging.PercentStyle(
+            "%(asctime)-15s \033[36m%(levelname)-8s\033[0m: %(message)s"
+        ),
+        logging.WARNING: logging.PercentStyle(_colored_format(33)),
+        logging.ERROR: logging.PercentStyle(_colored_format(31)),
+        logging.FATAL: logging.PercentStyle(_colored_format(31)),
+    }
+    _DEFAULT_STYLE = logging.PercentStyle(_colored_format(0))
+    # (epoch second, formatted date and time) of the last record
+    _time_cache = (None, "")
+
+    def usesTime(self):
+        # Every level's format starts with the timestamp
+        return True
+
+    def formatTime(self, record, datefmt=None):
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        # Frames are logged in bursts, so the date and time text is only
+        # rebuilt when the second changes
+        second = int(record.created)
+        cached_second, text = self._time_cache
+        if second != cached_second:
+            text = time.strftime(self.default_time_format, self.converter(second))
+            self._time_cache = (second, text)
+        return self.default_msec_format % (text, record.msecs)
+
+    def formatMessage(self, record):
+        return self._STYLES.get(record.levelno, self._DEFAULT_STYLE).format(record)
 
 
 class GuiLogHandler(logging.Handler):
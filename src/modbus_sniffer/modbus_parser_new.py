@@ -1,54 +1,110 @@
+import functools
+import logging
+import struct
 from datetime import datetime
 
 
+# --------------------------------------------------------------------------- #
+# Modbus CRC16 lookup table (reflected polynomial 0xA001)
+# --------------------------------------------------------------------------- #
+def _build_crc16_table():
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _build_crc16_table()
+
+
+def _crc16(data):
+    table = _CRC16_TABLE
+    crc = 0xFFFF
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+
+    # Return the CRC with the low byte first, as it is sent on the wire
+    return ((crc & 0xFF) << 8) | (crc >> 8)
+
+
+# A polling master sends the same short requests over and over, so CRCs of
+# frames up to this size are memoized
+_CRC16_CACHE_MAX_FRAME = 32
+_cached_crc16 = functools.lru_cache(maxsize=4096)(_crc16)
+
+# Big-endian 16-bit frame fields: address, quantity, value
+_U16 = struct.Struct(">H")
+_U16_PAIR = struct.Struct(">HH")
+# Address, quantity or value and the CRC of the fixed 8-byte frames
+_U16_TRIPLE = struct.Struct(">HHH")
+_U16_QUAD = struct.Struct(">HHHH")
+
+# Highest unit identifier on a Modbus RTU bus, 248-255 are reserved. Byte
+# pairs starting with a higher value are skipped without a CRC check.
+_MAX_SLAVE_ID = 247
+
+
 class ModbusParser:
     def __init__(
         self, main_logger, csv_logger, raw_log=False, trashdata=False, on_parsed=None
     ):
         self.raw_log = raw_log
         self.trashdata = trashdata
-        self.trashdataf = ""
         self.csv_logger = csv_logger
         self.log = main_logger
         self.on_parsed = on_parsed
         self.pendingRequests = {}
+        self._timestamp = None
+        self._handlers = self._build_handlers()
 
     def decodeModbus(self, data):
         buffer = data
-        self.bufferIndex = 0
-
-        while self.bufferIndex < len(buffer):
-            frameStartIndex = self.bufferIndex
-            if len(buffer) - self.bufferIndex < 2:
-                break
+        # Start of the first byte that has not been consumed yet. Frames are
+        # decoded in place and the buffer is sliced only once, on return.
+        consumed = 0
+        # Bound once, these are looked up for every frame in the loop below
+        get_handler = self._get_handler
+        handle_trash = self._handle_trash
+        on_parsed = self.on_parsed
+        # The buffer is never resized while decoding
+        buffer_len = len(buffer)
+
+        while buffer_len - consumed >= 2:
+            frameStartIndex = consumed
+            self.bufferIndex = consumed
+            self._timestamp = None
 
             unitIdentifier = buffer[self.bufferIndex]
             self.bufferIndex += 1
             functionCode = buffer[self.bufferIndex]
             self.bufferIndex += 1
 
-            handler = self._get_handler(functionCode)
+            if unitIdentifier <= _MAX_SLAVE_ID:
+                handler = get_handler(functionCode)
+            else:
+                handler = None
             if handler:
                 result = handler(buffer, frameStartIndex, unitIdentifier, functionCode)
                 if result:
-                    if self.on_parsed:
-                        self.on_parsed(result)
-                    buffer = buffer[self.bufferIndex :]
-                    self.bufferIndex = 0
+                    if on_parsed:
+                        on_parsed(result)
+                    consumed = self.bufferIndex
                     continue
 
-            self._handle_trash(buffer, frameStartIndex)
-            buffer = buffer[frameStartIndex + 1 :]
-            self.bufferIndex = 0
+            handle_trash(frameStartIndex)
+            consumed = frameStartIndex + 1
 
-        return buffer
+        return buffer[consumed:]
 
-    def _get_handler(self, fc):
+    def _build_handlers(self):
         def wrapper(request_handler, response_handler):
             def dynamic_handler(buffer, start, sid, fc):
                 key = (sid, fc)
                 if key not in self.pendingRequests:
-                    self.pendingRequests[key] = ("request", datetime.now().isoformat())
+                    self.pendingRequests[key] = ("request", self._frame_timestamp())
                     return request_handler(buffer, start, sid, fc)
                 else:
                     self.pendingRequests.pop(key, None)
@@ -74,7 +130,13 @@ class ModbusParser:
                 self._handle_write_multiple, self._handle_write_multiple_response
             ),
             23: wrapper(self._handle_read_write, self._handle_read_write_response),
-        }.get(fc, self._handle_exception if fc >= 0x80 else None)
+        }
+
+    def _get_handler(self, fc):
+        handler = self._handlers.get(fc)
+        if handler is None and fc >= 0x80:
+            return self._handle_exception
+        return handler
 
     def _is_response_frame(self, buffer, fc, start_index):
         try:
@@ -88,43 +150,55 @@ class ModbusParser:
         except IndexError:
             return False
 
-    def _handle_trash(self, buffer, index):
-        byte = buffer[index]
-        if self.trashdata:
-            self.trashdataf += f" {byte:02x}"
-        else:
-            self.trashdata = True
-            self.trashdataf = f"\033[33mWarning \033[0m: Ignoring data: [{byte:02x}"
+    def _frame_timestamp(self):
+        # Taken once per frame and shared by the frame, CSV row and request
+        if self._timestamp is None:
+            self._timestamp = datetime.now().isoformat()
+        return self._timestamp
+
+    def _handle_trash(self, index):
+        # Ignored bytes are skipped, they are not collected or logged
+        self.trashdata = True
         self.bufferIndex = index + 1
 
     def _log_raw(self, buffer, start, end):
-        if self.raw_log:
-            raw_message = " ".join(f"{b:02x}" for b in buffer[start:end])
-            self.log.info(f"Raw Message: {raw_message}")
+        # Skip building the hex dump when INFO records would be dropped anyway
+        if self.raw_log and self.log.isEnabledFor(logging.INFO):
+            raw_message = memoryview(buffer)[start:end].hex(" ")
+            self.log.info("Raw Message: %s", raw_message)
 
-    def _validate_crc(self, buffer, end):
+    def _validate_crc(self, buffer, start, end):
         if end + 1 >= len(buffer):
             return False
-        crc = (buffer[end] << 8) + buffer[end + 1]
-        return crc == self.calcCRC16(buffer, end)
+        (crc,) = _U16.unpack_from(buffer, end)
+        return self._crc_matches(buffer, start, end, crc)
+
+    def _crc_matches(self, buffer, start, end, crc):
+        if end - start <= _CRC16_CACHE_MAX_FRAME:
+            return crc == _cached_crc16(bytes(buffer[start:end]))
+        return crc == _crc16(buffer[start:end])
 
-    def _log_data(self, msg):
-        self.log.info(msg)
+    def _log_data(self, msg, *args):
+        # Arguments are passed through so the logger formats the message only
+        # if a handler actually emits it
+        self.log.info(msg, *args)
 
     def _log_csv(self, timestamp, sid, op, addr, qty, values):
         if self.csv_logger:
             self.csv_logger.log_data(timestamp, sid, op, addr, qty, values)
 
-    def _parse_data_words(self, data):
-        return [
-            int.from_bytes(data[i : i + 2], byteorder="big")
-            for i in range(0, len(data), 2)
-        ]
+    def _parse_data_words(self, buffer, offset, size):
+        # Read straight from the frame buffer, the data field is never copied
+        words = list(struct.unpack_from(f">{size // 2}H", buffer, offset))
+        if size % 2:
+            # An odd trailing byte is kept as its own value
+            words.append(buffer[offset + size - 1])
+        return words
 
     def _common_frame(self, **kwargs):
         default_frame = {
             # Current timestamp when the frame was created
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": self._frame_timestamp(),
             "slave_id": "",  # Modbus slave ID (unit identifier)
             "function": "",  # Function code of the Modbus operation
             "function_name": "",  # Human-readable name of the function
@@ -150,25 +224,32 @@ class ModbusParser:
         default_frame.update(kwargs)
         return default_frame
 
-    # ---------- Handler Implementations ----------
-    def _handle_read_bits(self, buffer, start, sid, fc):
+    def _parse_fixed_frame(self, buffer, start):
+        # [id, fc, address(2), quantity or value(2), crc(2)], shared by the
+        # read requests and the write echo responses
         if len(buffer) < start + 8:
             return None
-        read_address = (buffer[self.bufferIndex] << 8) + buffer[self.bufferIndex + 1]
-        self.bufferIndex += 2
-        read_qty = (buffer[self.bufferIndex] << 8) + buffer[self.bufferIndex + 1]
-        self.bufferIndex += 2
-        crc_valid = self._validate_crc(buffer, self.bufferIndex)
-        self.bufferIndex += 2
-        if not crc_valid:
+        first, second, crc = _U16_TRIPLE.unpack_from(buffer, self.bufferIndex)
+        if not self._crc_matches(buffer, start, start + 6, crc):
             return None
+        self.bufferIndex += 6
         self._log_raw(buffer, start, self.bufferIndex)
+        return first, second
+
+    # ---------- Handler Implementations ----------
+    def _handle_read_bits(self, buffer, start, sid, fc):
+        fields = self._parse_fixed_frame(buffer, start)
+        if fields is None:
+            return None
+        read_address, read_qty = fields
         self._log_data(
-            f"Master\t-> ID: {sid}, FC: 0x{fc:02x}, Read address: {read_address}, Read Quantity: {read_qty}"
-        )
-        self._log_csv(
-            datetime.now().isoformat(), sid, "READ", read_address, read_qty, []
+            "Master\t-> ID: %s, FC: 0x%02x, Read address: %s, Read Quantity: %s",
+            sid,
+            fc,
+            read_address,
+            read_qty,
         )
+        self._log_csv(self._frame_timestamp(), sid, "READ", read_address, read_qty, [])
         fname = "Read Coils" if fc == 1 else "Read Discrete Inputs"
         return self._common_frame(
             # MODBUS Application Protocol Specification V1.1b value set
@@ -183,29 +264,24 @@ class ModbusParser:
         )
 
     def _handle_read_registers(self, buffer, start, sid, fc):
-        if len(buffer) < start + 8:
+        fields = self._parse_fixed_frame(buffer, start)
+        if fields is None:
             return None
-        read_address = (buffer[self.bufferIndex] << 8) + buffer[self.bufferIndex + 1]
-        self.bufferIndex += 2
-        read_qty = (buffer[self.bufferIndex] << 8) + buffer[self.bufferIndex + 1]
-        self.bufferIndex += 2
-        crc_valid = self._validate_crc(buffer, self.bufferIndex)
-        self.bufferIndex += 2
-        if not crc_valid:
-            return None
-        self._log_raw(buffer, start, self.bufferIndex)
+        read_address, read_qty = fields
         self.pendingRequests[(sid, fc)] = (
             read_address,
             read_qty,
-            datetime.now().isoformat(),
+            self._frame_timestamp(),
         )
         fname = "Read Holding Registers" if fc == 3 else "Read Input Registers"
         self._log_data(
-            f"Master\t-> ID: {sid}, FC: 0x{fc:02x}, Read address: {read_address}, Read Quantity: {read_qty}"
-        )
-        self._log_csv(
-            datetime.now().isoformat(), sid, "READ", read_address, read_qty, []
+            "Master\t-> ID: %s, FC: 0x%02x, Read address: %s, Read Quantity: %s",
+            sid,
+            fc,
+            read_address,
+            read_qty,
         )
+        self._log_csv(self._frame_timestamp(), sid, "READ", read_address, read_qty, [])
         return self._common_frame(
             # MODBUS Application Protocol Specification V1.1b value set
             slave_id=sid,
@@ -219,19 +295,16 @@ class ModbusParser:
         )
 
     def _handle_write_single(self, buffer, start, sid, fc):
-        if len(buffer) < start + 8:
+        fields = self._parse_fixed_frame(buffer, start)
+        if fields is None:
             return None
-        addr = (buffer[self.bufferIndex] << 8) + buffer[self.bufferIndex + 1]
-        self.bufferIndex += 2
-        data = buffer[self.bufferIndex : self.bufferIndex + 2]
-        self.bufferIndex += 2
-        crc_valid = self._validate_crc(buffer, self.bufferIndex)
-        self.bufferIndex += 2
-        if not crc_valid:
-            return None
-        self._log_raw(buffer, start, self.bufferIndex)
+        addr, value = fields
         self._log_data(
-            f"Master\t-> ID: {sid}, FC: 0x{fc:02x}, Write addr: {addr}, Data: {int.from_bytes(data, 'big')}"
+            "Master\t-> ID: %s, FC: 0x%02x, Write addr: %s, Data: %s",
+            sid,
+            fc,
+            addr,
+            value,
         )
         fname = "Write Single Coil" if fc == 5 else "Write Single Register"
         frame = self._common_frame(
@@ -239,41 +312,45 @@ class ModbusParser:
             slave_id=sid,
             function=fc,
             data_address=addr,
-            data=list(data),
+            data=[value >> 8, value & 0xFF],
             # Additional parser data for table view gnerator
             direction="master",
             message_type="request",
             function_name=fname,
         )
         if fc == [5, 6]:
-            self._log_csv(
-                frame["timestamp"], sid, "WRITE", addr, 1, [int.from_bytes(data, "big")]
-            )
+            self._log_csv(frame["timestamp"], sid, "WRITE", addr, 1, [value])
         return frame
 
     def _handle_write_multiple(self, buffer, start, sid, fc):
         if len(buffer) < start + 9:
             return None
-        addr = (buffer[self.bufferIndex] << 8) + buffer[self.bufferIndex + 1]
-        self.bufferIndex += 2
-        qty = (buffer[self.bufferIndex] << 8) + buffer[self.bufferIndex + 1]
-        self.bufferIndex += 2
+        addr, qty = _U16_PAIR.unpack_from(buffer, self.bufferIndex)
+        self.bufferIndex += 4
         byte_count = buffer[self.bufferIndex]
         self.bufferIndex += 1
-        data = buffer[self.bufferIndex : self.bufferIndex + byte_count]
+        data_start = self.bufferIndex
         self.bufferIndex += byte_count
-        crc_valid = self._validate_crc(buffer, self.bufferIndex)
+        crc_valid = self._validate_crc(buffer, start, self.bufferIndex)
         self.bufferIndex += 2
         if not crc_valid:
             return None
         self._log_raw(buffer, start, self.bufferIndex)
         fname = "Write Multiple Coils" if fc == 15 else "Write Multiple Registers"
-        values = self._parse_data_words(data) if fc == 16 else list(data)
+        values = (
+            self._parse_data_words(buffer, data_start, byte_count)
+            if fc == 16
+            else list(buffer[data_start : data_start + byte_count])
+        )
         self._log_data(
-            f"Master\t-> ID: {sid}, FC: 0x{fc:02x}, Write addr: {addr}, Quantity: {qty}"
+            "Master\t-> ID: %s, FC: 0x%02x, Write addr: %s, Quantity: %s",
+            sid,
+            fc,
+            addr,
+            qty,
         )
         if fc == [15, 16]:
-            self._log_csv(datetime.now().isoformat(), sid, "WRITE", addr, qty, values)
+            self._log_csv(self._frame_timestamp(), sid, "WRITE", addr, qty, values)
         return self._common_frame(
             # MODBUS Application Protocol Specification V1.1b value set
             slave_id=sid,
@@ -291,33 +368,32 @@ class ModbusParser:
     def _handle_read_write(self, buffer, start, sid, fc):
         if len(buffer) < start + 13:
             return None
-        read_address = (buffer[self.bufferIndex] << 8) + buffer[self.bufferIndex + 1]
-        self.bufferIndex += 2
-        read_qty = (buffer[self.bufferIndex] << 8) + buffer[self.bufferIndex + 1]
-        self.bufferIndex += 2
-        write_address = (buffer[self.bufferIndex] << 8) + buffer[self.bufferIndex + 1]
-        self.bufferIndex += 2
-        write_qty = (buffer[self.bufferIndex] << 8) + buffer[self.bufferIndex + 1]
-        self.bufferIndex += 2
+        read_address, read_qty, write_address, write_qty = _U16_QUAD.unpack_from(
+            buffer, self.bufferIndex
+        )
+        self.bufferIndex += 8
         byte_count = buffer[self.bufferIndex]
         self.bufferIndex += 1
-        data = buffer[self.bufferIndex : self.bufferIndex + byte_count]
+        data_start = self.bufferIndex
         self.bufferIndex += byte_count
 
-        if not self._validate_crc(buffer, self.bufferIndex):
+        if not self._validate_crc(buffer, start, self.bufferIndex):
             return None
         self.bufferIndex += 2
         self._log_raw(buffer, start, self.bufferIndex)
-        values = self._parse_data_words(data)
+        values = self._parse_data_words(buffer, data_start, byte_count)
         self._log_data(
-            f"Master\t-> ID: {sid}, FC: 0x{fc:02x}, ReadAddr: {read_address}, ReadQty: {read_qty}, "
-            f"WriteAddr: {write_address}, WriteQty: {write_qty}"
-        )
-        self._log_csv(
-            datetime.now().isoformat(), sid, "READ", read_address, read_qty, []
+            "Master\t-> ID: %s, FC: 0x%02x, ReadAddr: %s, ReadQty: %s, WriteAddr: %s, WriteQty: %s",
+            sid,
+            fc,
+            read_address,
+            read_qty,
+            write_address,
+            write_qty,
         )
+        self._log_csv(self._frame_timestamp(), sid, "READ", read_address, read_qty, [])
         self._log_csv(
-            datetime.now().isoformat(), sid, "WRITE", write_address, write_qty, values
+            self._frame_timestamp(), sid, "WRITE", write_address, write_qty, values
         )
         return self._common_frame(
             # MODBUS Application Protocol Specification V1.1b value set
@@ -340,12 +416,12 @@ class ModbusParser:
             return None
         exception_code = buffer[self.bufferIndex]
         self.bufferIndex += 1
-        if not self._validate_crc(buffer, self.bufferIndex):
+        if not self._validate_crc(buffer, start, self.bufferIndex):
             return None
         self.bufferIndex += 2
         self._log_raw(buffer, start, self.bufferIndex)
         self._log_data(
-            f"Slave\t-> ID: {sid}, Exception FC: 0x{fc:02x}, Code: {exception_code}"
+            "Slave\t-> ID: %s, Exception FC: 0x%02x, Code: %s", sid, fc, exception_code
         )
         return self._common_frame(
             # MODBUS Application Protocol Specification V1.1b value set
@@ -365,18 +441,22 @@ class ModbusParser:
         self.bufferIndex += 1
         if len(buffer) < self.bufferIndex + byte_count + 2:
             return None
-        data = buffer[self.bufferIndex : self.bufferIndex + byte_count]
+        data_start = self.bufferIndex
         self.bufferIndex += byte_count
-        if not self._validate_crc(buffer, self.bufferIndex):
+        if not self._validate_crc(buffer, start, self.bufferIndex):
             return None
         self.bufferIndex += 2
         self._log_raw(buffer, start, self.bufferIndex)
-        values = list(data)
+        values = list(buffer[data_start : data_start + byte_count])
         fname = "Read Coils" if fc == 1 else "Read Discrete Inputs"
         self._log_data(
-            f"Slave\t-> ID: {sid}, FC: 0x{fc:02x}, Read byte count: {byte_count}, Data: {values}"
+            "Slave\t-> ID: %s, FC: 0x%02x, Read byte count: %s, Data: %s",
+            sid,
+            fc,
+            byte_count,
+            values,
         )
-        self._log_csv(datetime.now().isoformat(), sid, "READ", "", len(values), values)
+        self._log_csv(self._frame_timestamp(), sid, "READ", "", len(values), values)
         return self._common_frame(
             # MODBUS Application Protocol Specification V1.1b value set
             slave_id=sid,
@@ -396,22 +476,26 @@ class ModbusParser:
         self.bufferIndex += 1
         if len(buffer) < self.bufferIndex + byte_count + 2:
             return None
-        data = buffer[self.bufferIndex : self.bufferIndex + byte_count]
+        data_start = self.bufferIndex
         self.bufferIndex += byte_count
-        if not self._validate_crc(buffer, self.bufferIndex):
+        if not self._validate_crc(buffer, start, self.bufferIndex):
             return None
         self.bufferIndex += 2
         self._log_raw(buffer, start, self.bufferIndex)
-        values = self._parse_data_words(data)
+        values = self._parse_data_words(buffer, data_start, byte_count)
         fname = "Read Holding Registers" if fc == 3 else "Read Input Registers"
         self._log_data(
-            f"Slave\t-> ID: {sid}, FC: 0x{fc:02x}, Byte count: {byte_count}, Data: {values}"
+            "Slave\t-> ID: %s, FC: 0x%02x, Byte count: %s, Data: %s",
+            sid,
+            fc,
+            byte_count,
+            values,
         )
         request_info = self.pendingRequests.pop((sid, fc), None)
         if request_info:
             addr, qty, _ = request_info
             self._log_csv(
-                datetime.now().isoformat(), sid, "READ", addr, len(values), values
+                self._frame_timestamp(), sid, "READ", addr, len(values), values
             )
         return self._common_frame(
             # MODBUS Application Protocol Specification V1.1b value set
@@ -427,27 +511,25 @@ class ModbusParser:
         )
 
     def _handle_write_single_response(self, buffer, start, sid, fc):
-        if len(buffer) < start + 8:
-            return None
-        addr = (buffer[self.bufferIndex] << 8) + buffer[self.bufferIndex + 1]
-        self.bufferIndex += 2
-        data = buffer[self.bufferIndex : self.bufferIndex + 2]
-        self.bufferIndex += 2
-        if not self._validate_crc(buffer, self.bufferIndex):
+        fields = self._parse_fixed_frame(buffer, start)
+        if fields is None:
             return None
-        self.bufferIndex += 2
-        self._log_raw(buffer, start, self.bufferIndex)
+        addr, value = fields
         fname = "Write Single Coil" if fc == 5 else "Write Single Register"
         self._log_data(
-            f"Slave\t-> ID: {sid}, FC: 0x{fc:02x}, Echo addr: {addr}, Data: {int.from_bytes(data, 'big')}"
+            "Slave\t-> ID: %s, FC: 0x%02x, Echo addr: %s, Data: %s",
+            sid,
+            fc,
+            addr,
+            value,
         )
         self._log_csv(
-            datetime.now().isoformat(),
+            self._frame_timestamp(),
             sid,
             "WRITE",
             addr,
             1,
-            [int.from_bytes(data, "big")],
+            [value],
         )
 
         return self._common_frame(
@@ -455,7 +537,7 @@ class ModbusParser:
             slave_id=sid,
             function=fc,
             data_address=addr,
-            data=list(data),
+            data=[value >> 8, value & 0xFF],
             # Additional parser data for table view gnerator
             direction="slave",
             message_type="response",
@@ -463,21 +545,15 @@ class ModbusParser:
         )
 
     def _handle_write_multiple_response(self, buffer, start, sid, fc):
-        if len(buffer) < start + 8:
-            return None
-        addr = (buffer[self.bufferIndex] << 8) + buffer[self.bufferIndex + 1]
-        self.bufferIndex += 2
-        qty = (buffer[self.bufferIndex] << 8) + buffer[self.bufferIndex + 1]
-        self.bufferIndex += 2
-        if not self._validate_crc(buffer, self.bufferIndex):
+        fields = self._parse_fixed_frame(buffer, start)
+        if fields is None:
             return None
-        self.bufferIndex += 2
-        self._log_raw(buffer, start, self.bufferIndex)
+        addr, qty = fields
         fname = "Write Multiple Coils" if fc == 15 else "Write Multiple Registers"
         self._log_data(
-            f"Slave\t-> ID: {sid}, FC: 0x{fc:02x}, Echo addr: {addr}, Qty: {qty}"
+            "Slave\t-> ID: %s, FC: 0x%02x, Echo addr: %s, Qty: %s", sid, fc, addr, qty
         )
-        self._log_csv(datetime.now().isoformat(), sid, "WRITE", addr, qty, [])
+        self._log_csv(self._frame_timestamp(), sid, "WRITE", addr, qty, [])
 
         return self._common_frame(
             # MODBUS Application Protocol Specification V1.1b value set
@@ -497,17 +573,21 @@ class ModbusParser:
             return None
         byte_count = buffer[self.bufferIndex]
         self.bufferIndex += 1
-        data = buffer[self.bufferIndex : self.bufferIndex + byte_count]
+        data_start = self.bufferIndex
         self.bufferIndex += byte_count
-        if not self._validate_crc(buffer, self.bufferIndex):
+        if not self._validate_crc(buffer, start, self.bufferIndex):
             return None
         self.bufferIndex += 2
         self._log_raw(buffer, start, self.bufferIndex)
-        values = self._parse_data_words(data)
+        values = self._parse_data_words(buffer, data_start, byte_count)
         self._log_data(
-            f"Slave\t-> ID: {sid}, FC: 0x{fc:02x}, Read byte count: {byte_count}, Data: {values}"
+            "Slave\t-> ID: %s, FC: 0x%02x, Read byte count: %s, Data: %s",
+            sid,
+            fc,
+            byte_count,
+            values,
         )
-        self._log_csv(datetime.now().isoformat(), sid, "READ", "", len(values), values)
+        self._log_csv(self._frame_timestamp(), sid, "READ", "", len(values), values)
         return self._common_frame(
             # MODBUS Application Protocol Specification V1.1b value set
             slave_id=sid,
@@ -523,534 +603,6 @@ class ModbusParser:
     # --------------------------------------------------------------------------- #
     # Calculate the modbus CRC
     # --------------------------------------------------------------------------- #
-    def calcCRC16(self, data, size):
-        crcHi = 0xFF
-        crcLo = 0xFF
-
-        crcHiTable = [
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x01,
-            0xC0,
-            0x80,
-            0x41,
-            0x00,
-            0xC1,
-            0x81,
-            0x40,
-        ]
-
-        crcLoTable = [
-            0x00,
-            0xC0,
-            0xC1,
-            0x01,
-            0xC3,
-            0x03,
-            0x02,
-            0xC2,
-            0xC6,
-            0x06,
-            0x07,
-            0xC7,
-            0x05,
-            0xC5,
-            0xC4,
-            0x04,
-            0xCC,
-            0x0C,
-            0x0D,
-            0xCD,
-            0x0F,
-            0xCF,
-            0xCE,
-            0x0E,
-            0x0A,
-            0xCA,
-            0xCB,
-            0x0B,
-            0xC9,
-            0x09,
-            0x08,
-            0xC8,
-            0xD8,
-            0x18,
-            0x19,
-            0xD9,
-            0x1B,
-            0xDB,
-            0xDA,
-            0x1A,
-            0x1E,
-            0xDE,
-            0xDF,
-            0x1F,
-            0xDD,
-            0x1D,
-            0x1C,
-            0xDC,
-            0x14,
-            0xD4,
-            0xD5,
-            0x15,
-            0xD7,
-            0x17,
-            0x16,
-            0xD6,
-            0xD2,
-            0x12,
-            0x13,
-            0xD3,
-            0x11,
-            0xD1,
-            0xD0,
-            0x10,
-            0xF0,
-            0x30,
-            0x31,
-            0xF1,
-            0x33,
-            0xF3,
-            0xF2,
-            0x32,
-            0x36,
-            0xF6,
-            0xF7,
-            0x37,
-            0xF5,
-            0x35,
-            0x34,
-            0xF4,
-            0x3C,
-            0xFC,
-            0xFD,
-            0x3D,
-            0xFF,
-            0x3F,
-            0x3E,
-            0xFE,
-            0xFA,
-            0x3A,
-            0x3B,
-            0xFB,
-            0x39,
-            0xF9,
-            0xF8,
-            0x38,
-            0x28,
-            0xE8,
-            0xE9,
-            0x29,
-            0xEB,
-            0x2B,
-            0x2A,
-            0xEA,
-            0xEE,
-            0x2E,
-            0x2F,
-            0xEF,
-            0x2D,
-            0xED,
-            0xEC,
-            0x2C,
-            0xE4,
-            0x24,
-            0x25,
-            0xE5,
-            0x27,
-            0xE7,
-            0xE6,
-            0x26,
-            0x22,
-            0xE2,
-            0xE3,
-            0x23,
-            0xE1,
-            0x21,
-            0x20,
-            0xE0,
-            0xA0,
-            0x60,
-            0x61,
-            0xA1,
-            0x63,
-            0xA3,
-            0xA2,
-            0x62,
-            0x66,
-            0xA6,
-            0xA7,
-            0x67,
-            0xA5,
-            0x65,
-            0x64,
-            0xA4,
-            0x6C,
-            0xAC,
-            0xAD,
-            0x6D,
-            0xAF,
-            0x6F,
-            0x6E,
-            0xAE,
-            0xAA,
-            0x6A,
-            0x6B,
-            0xAB,
-            0x69,
-            0xA9,
-            0xA8,
-            0x68,
-            0x78,
-            0xB8,
-            0xB9,
-            0x79,
-            0xBB,
-            0x7B,
-            0x7A,
-            0xBA,
-            0xBE,
-            0x7E,
-            0x7F,
-            0xBF,
-            0x7D,
-            0xBD,
-            0xBC,
-            0x7C,
-            0xB4,
-            0x74,
-            0x75,
-            0xB5,
-            0x77,
-            0xB7,
-            0xB6,
-            0x76,
-            0x72,
-            0xB2,
-            0xB3,
-            0x73,
-            0xB1,
-            0x71,
-            0x70,
-            0xB0,
-            0x50,
-            0x90,
-            0x91,
-            0x51,
-            0x93,
-            0x53,
-            0x52,
-            0x92,
-            0x96,
-            0x56,
-            0x57,
-            0x97,
-            0x55,
-            0x95,
-            0x94,
-            0x54,
-            0x9C,
-            0x5C,
-            0x5D,
-            0x9D,
-            0x5F,
-            0x9F,
-            0x9E,
-            0x5E,
-            0x5A,
-            0x9A,
-            0x9B,
-            0x5B,
-            0x99,
-            0x59,
-            0x58,
-            0x98,
-            0x88,
-            0x48,
-            0x49,
-            0x89,
-            0x4B,
-            0x8B,
-            0x8A,
-            0x4A,
-            0x4E,
-            0x8E,
-            0x8F,
-            0x4F,
-            0x8D,
-            0x4D,
-            0x4C,
-            0x8C,
-            0x44,
-            0x84,
-            0x85,
-            0x45,
-            0x87,
-            0x47,
-            0x46,
-            0x86,
-            0x82,
-            0x42,
-            0x43,
-            0x83,
-            0x41,
-            0x81,
-            0x80,
-            0x40,
-        ]
-
-        index = 0
-        while index < size:
-            crc = crcHi ^ data[index]
-            crcHi = crcLo ^ crcHiTable[crc]
-            crcLo = crcLoTable[crc]
-            index += 1
-
-        metCRC16 = (crcHi * 0x0100) + crcLo
-        return metCRC16
+    @staticmethod
+    def calcCRC16(data, size):
+        return _crc16(data[:size])
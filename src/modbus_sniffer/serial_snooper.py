@@ -33,6 +33,7 @@ class SerialSnooper:
                 daily_file=daily_file,
                 output_dir="./csv_logs",
                 base_filename="log",
+                background=True,
             )
             if csv_log
             else None
@@ -60,7 +61,6 @@ class SerialSnooper:
         # Global variables
         self.data = bytearray(0)
         self.trashdata = False
-        self.trashdataf = bytearray(0)
 
     def __enter__(self):
         return self
@@ -77,7 +77,9 @@ class SerialSnooper:
             self.csv_logger.close()
 
     def read_raw(self, n=1):
-        return self.connection.read(n)
+        # Take everything the driver has already buffered in a single call.
+        # Only when nothing is waiting block for up to the inter-frame timeout.
+        return self.connection.read(self.connection.in_waiting or n)
 
     # --------------------------------------------------------------------------- #
     # Buffer the data and call the decoder if the interframe timeout occurs.
@@ -91,8 +93,8 @@ class SerialSnooper:
         """
         if self.raw_only and data:
             # If the user wants to log raw, produce a hex representation
-            raw_message = " ".join(f"{byte:02x}" for byte in data)
-            self.log.info(f"Raw RS485 data: {raw_message}")
+            raw_message = data.hex(" ")
+            self.log.info("Raw RS485 data: %s", raw_message)
             return  # skip decode entirely
 
         if len(data) <= 0:
@@ -109,8 +111,7 @@ class SerialSnooper:
             return
 
         # Otherwise, accumulate and decode as normal
-        for dat in data:
-            self.data.append(dat)
+        self.data.extend(data)
 
     def emit_parsed_data(self, parsed_data):
         self.log.debug(f"Parsed data ready: {parsed_data}")
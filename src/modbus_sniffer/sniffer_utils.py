@@ -1,5 +1,12 @@
 import serial
 
+# Parity names accepted from the CLI and GUI, anything else falls back to odd
+_PARITY = {
+    "none": serial.PARITY_NONE,
+    "even": serial.PARITY_EVEN,
+    "odd": serial.PARITY_ODD,
+}
+
 
 def normalize_sniffer_config(
     port,
@@ -13,12 +20,7 @@ def normalize_sniffer_config(
     csv=False,
     GUI=False,
 ):
-    if parity_str == "none":
-        parity = serial.PARITY_NONE
-    elif parity_str == "even":
-        parity = serial.PARITY_EVEN
-    else:
-        parity = serial.PARITY_ODD
+    parity = _PARITY.get(parity_str, serial.PARITY_ODD)
 
     timeout = (
         calcTimeout(baudrate) if timeout_input is None else float(timeout_input) / 1000
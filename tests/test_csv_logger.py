@@ -1,6 +1,8 @@
+import pytest
 import os
 import csv
 import tempfile
+import threading
 from unittest import mock
 from itertools import cycle
 from modbus_sniffer.csv_logger import CSVLogger
@@ -88,3 +90,81 @@ def test_close_twice_is_safe():
         logger = CSVLogger(enable_csv=True, output_dir=tmpdir)
         logger.close()
         logger.close()  # should not raise
+
+
+def test_rows_are_flushed_in_batches():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = CSVLogger(
+            enable_csv=True, output_dir=tmpdir, flush_rows=2, flush_interval=3600
+        )
+        file_path = logger.csv_file.name
+
+        logger.log_data("2024-01-01 12:00:00", 1, "READ", 100, 1, [42])
+        with open(file_path, newline="") as f:
+            assert len(list(csv.reader(f))) == 1  # row still buffered
+
+        logger.log_data("2024-01-01 12:00:01", 1, "READ", 100, 1, [43])
+        with open(file_path, newline="") as f:
+            rows = list(csv.reader(f))
+        assert [row[3] for row in rows[1:]] == ["42", "43"]
+        logger.close()
+
+
+def test_header_rewrite_leaves_no_temporary_file():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = CSVLogger(enable_csv=True, output_dir=tmpdir)
+        logger.log_data("2024-01-01 12:00:00", 1, "READ", 100, 1, [42])
+        logger.log_data("2024-01-01 12:01:00", 2, "READ", 7, 2, [1, 2])
+        logger.close()
+
+        assert len(os.listdir(tmpdir)) == 1
+
+
+def test_background_writer_drains_queue_on_close():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = CSVLogger(enable_csv=True, output_dir=tmpdir, background=True)
+        file_path = logger.csv_file.name
+        for i in range(500):
+            logger.log_data(f"2024-01-01 12:00:{i}", 1, "READ", 0, 2, [i, i + 1])
+        logger.close()
+
+        with open(file_path, newline="") as f:
+            rows = list(csv.reader(f))
+        assert rows[0] == ["Timestamp", "Slave ID", "Operation", "Reg_1_0", "Reg_1_1"]
+        assert len(rows) == 501
+        assert rows[-1][3:] == ["499", "500"]
+
+
+def test_background_writer_survives_failed_row():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = CSVLogger(enable_csv=True, output_dir=tmpdir, background=True)
+        file_path = logger.csv_file.name
+        # Responses without a start register cannot be mapped to columns
+        logger.log_data("2024-01-01 12:00:00", 1, "READ", "", 2, [1, 2])
+        logger._queue.join()
+
+        assert logger._thread.is_alive()
+        with pytest.raises(TypeError):
+            logger.log_data("2024-01-01 12:00:01", 1, "READ", 0, 1, [5])
+
+        logger.log_data("2024-01-01 12:00:02", 1, "READ", 0, 1, [7])
+        logger.close()
+
+        with open(file_path, newline="") as f:
+            rows = list(csv.reader(f))
+        assert [row[3] for row in rows[1:]] == ["5", "7"]
+
+
+def test_background_writer_error_is_raised_on_close():
+    with tempfile.TemporaryDirectory() as tmpdir:
+        logger = CSVLogger(enable_csv=True, output_dir=tmpdir, background=True)
+        # Hold the writer until close() so the row fails after log_data returns
+        release = threading.Event()
+        write_row = logger._write_row
+        logger._write_row = lambda *row: release.wait() and write_row(*row)
+        logger.log_data("2024-01-01 12:00:00", 1, "READ", "", 2, [1, 2])
+        release.set()
+
+        with pytest.raises(TypeError):
+            logger.close()
+        assert logger.csv_file is None
@@ -156,3 +156,21 @@ def test_daily_file_handler_is_timed_rotating_file_handler(tmp_path):
     finally:
         if old_file is not None:
             setattr(module, "__file__", old_file)
+
+
+def test_formatter_time_matches_default_formatter():
+    formatter = MyFormatter()
+    reference = logging.Formatter()
+    for created in (1700000000.25, 1700000000.75, 1700000001.5):
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="",
+            lineno=0,
+            msg="msg",
+            args=(),
+            exc_info=None,
+        )
+        record.created = created
+        record.msecs = (created - int(created)) * 1000
+        assert formatter.formatTime(record) == reference.formatTime(record)
@@ -30,3 +30,29 @@ def test_serial_snooper_read_and_process(mock_serial):
         snooper.process_data(data)
 
     logger.info.assert_called()  # at least one logging call
+
+
+@patch("modbus_sniffer.serial_snooper.serial.Serial")
+def test_read_raw_takes_all_waiting_bytes(mock_serial):
+    serial_instance = MagicMock()
+    mock_serial.return_value = serial_instance
+    snooper = SerialSnooper(main_logger=MagicMock(), port="/dev/null")
+
+    serial_instance.in_waiting = 5
+    snooper.read_raw()
+    serial_instance.read.assert_called_with(5)
+
+    serial_instance.in_waiting = 0
+    snooper.read_raw()
+    serial_instance.read.assert_called_with(1)
+
+
+@patch("modbus_sniffer.serial_snooper.serial.Serial")
+def test_raw_only_logs_hex(mock_serial):
+    logger = MagicMock()
+    snooper = SerialSnooper(main_logger=logger, port="/dev/null", raw_only=True)
+
+    snooper.process_data(b"\x01\x03\xff")
+
+    logger.info.assert_called_with("Raw RS485 data: %s", "01 03 ff")
+    assert snooper.data == bytearray()
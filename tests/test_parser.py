@@ -1,7 +1,7 @@
+import logging
 import pytest
 from modbus_sniffer.modbus_parser_new import ModbusParser
 
-
 # @pytest.fixture
 # def parser():
 #     main_logger = DummyLogger()
@@ -273,3 +273,73 @@ def test_read_write_multiple_registers_request_and_response(setup_parser):
     assert resp_frame["function"] == 23
     assert resp_frame["message_type"] == "response"
     assert resp_frame["data"] == [1, 2]
+
+
+def test_calc_crc16_known_values():
+    parser = ModbusParser(Mock(), None)
+    # CRC bytes as sent on the wire: low byte first
+    assert parser.calcCRC16(bytes([1, 3, 0, 0, 0, 1]), 6) == 0x840A
+    assert parser.calcCRC16(bytes([1, 3, 2, 0x00, 0x0A]), 5) == 0x3843
+    # Only the first `size` bytes take part in the calculation
+    assert parser.calcCRC16(bytes([1, 3, 0, 0, 0, 1, 0x84, 0x0A]), 6) == 0x840A
+
+
+def test_back_to_back_frames_in_one_buffer(setup_parser):
+    parser, log, csv, on_parsed = setup_parser
+
+    req = build_frame(bytes([1, 3, 0x00, 0x0A, 0x00, 0x02]))
+    resp = build_frame(bytes([1, 3, 4, 0x00, 0x01, 0x00, 0x02]))
+
+    leftover = parser.decodeModbus(bytearray(req + resp))
+
+    assert on_parsed.call_count == 2
+    assert on_parsed.call_args_list[0][0][0]["message_type"] == "request"
+    assert on_parsed.call_args_list[1][0][0]["data"] == [1, 2]
+    assert isinstance(leftover, bytearray)
+    assert leftover == b""
+
+
+def test_decoded_frame_log_message(caplog):
+    log = logging.getLogger("test_parser_log")
+    parser = ModbusParser(log, None)
+
+    with caplog.at_level(logging.INFO, logger="test_parser_log"):
+        parser.decodeModbus(build_frame(bytes([1, 3, 0x00, 0x0A, 0x00, 0x02])))
+
+    assert caplog.messages == [
+        "Master\t-> ID: 1, FC: 0x03, Read address: 10, Read Quantity: 2"
+    ]
+
+
+def test_raw_message_skipped_when_info_disabled():
+    log = Mock()
+    log.isEnabledFor.return_value = False
+    parser = ModbusParser(log, None, raw_log=True)
+
+    parser.decodeModbus(build_frame(bytes([1, 3, 0x00, 0x0A, 0x00, 0x02])))
+
+    logged = [c.args[0] for c in log.info.call_args_list]
+    assert "Raw Message: %s" not in logged
+
+
+def test_ignored_bytes_before_frame_are_skipped(setup_parser):
+    parser, log, csv, on_parsed = setup_parser
+    leftover = parser.decodeModbus(b"\xaa\xbb" + build_frame(bytes([1, 6, 0, 1, 0, 2])))
+
+    assert parser.trashdata
+    assert leftover == b""
+    on_parsed.assert_called_once()
+    assert on_parsed.call_args.args[0]["slave_id"] == 1
+
+
+def test_calc_crc16_without_instance():
+    assert ModbusParser.calcCRC16(bytes([1, 3, 0, 0, 0, 1]), 6) == 0x840A
+
+
+def test_reserved_unit_identifier_is_ignored(setup_parser):
+    parser, log, csv, on_parsed = setup_parser
+    parser.decodeModbus(build_frame(bytes([0xF8, 6, 0, 1, 0, 2])))
+    on_parsed.assert_not_called()
+
+    parser.decodeModbus(build_frame(bytes([0, 6, 0, 1, 0, 2])))
+    on_parsed.assert_called_once()